@@ -78,10 +78,20 @@ class WavelengthAnalyzer:
         # Create function mapping time to wavelength.
         self.mapping = np.poly1d(fit)
 
+        # Every channel of an acquisition is cropped to the same window, so
+        # the wavelengths only need to be calculated once. The array is shared
+        # by all results, so it is made read-only.
+        device_time = np.arange(self.peaks[-1] - self.peaks[0]) / self.sample_rate
+        self.wavelengths = self.mapping(device_time)
+        self.wavelengths.flags.writeable = False
+
     def process_data(self, raw_data: np.ndarray) -> AnalysisResult:
         """
         Converts raw data to wavelength by interpolating against wavelength logs.
 
+        The wavelengths of the result are a read-only view shared by every
+        channel processed with this analyzer; copy them before modifying.
+
         Parameters
         ----------
         raw_data : ndarray
@@ -94,11 +104,5 @@ class WavelengthAnalyzer:
             "wavelength_hash", and "data_hash".
         """
         data = raw_data[self.peaks[0]:self.peaks[-1]]
-        
-        # Time relative to the first collected data point.
-        device_time = np.arange(len(data)) / self.sample_rate
-
-        # Get wavelengths at given times.
-        wls = self.mapping(device_time)
 
-        return AnalysisResult(wls, data)
+        return AnalysisResult(self.wavelengths[:len(data)], data)
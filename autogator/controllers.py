@@ -272,11 +272,8 @@ class KeyboardControl:
         """
         Enters a blocking loop to control stage motion.
         """
-        running = threading.Event()
-        running.set()
+        done = threading.Event()
 
-        actions = list(self.bindings.dict().keys())
-        keys = list(self.bindings.dict().values())
         funcs = {
             "MOVE_LEFT": self._move_left,
             "MOVE_RIGHT": self._move_right,
@@ -298,43 +295,42 @@ class KeyboardControl:
             "HOME": self._home,
             "HELP": self._help,
         }
-        flags = {binding : threading.Event() for binding in actions}
-
-        # keyboard.add_hotkey(self.bindings.MOVE_LEFT, lambda: self._move_left(semaphores[self.bindings.MOVE_LEFT]))
-        keyboard.add_hotkey(self.bindings.MOVE_LEFT, lambda: flags["MOVE_LEFT"].set())
-        keyboard.add_hotkey(self.bindings.MOVE_RIGHT, lambda: flags["MOVE_RIGHT"].set())
-        keyboard.add_hotkey(self.bindings.MOVE_UP, lambda: flags["MOVE_UP"].set())
-        keyboard.add_hotkey(self.bindings.MOVE_DOWN, lambda: flags["MOVE_DOWN"].set())
-        keyboard.add_hotkey(self.bindings.MOVE_RAISE, lambda: flags["MOVE_RAISE"].set())
-        keyboard.add_hotkey(self.bindings.MOVE_LOWER, lambda: flags["MOVE_LOWER"].set())
-        keyboard.add_hotkey(self.bindings.JOG_LEFT, lambda: flags["JOG_LEFT"].set())
-        keyboard.add_hotkey(self.bindings.JOG_RIGHT, lambda: flags["JOG_RIGHT"].set())
-        keyboard.add_hotkey(self.bindings.JOG_UP, lambda: flags["JOG_UP"].set())
-        keyboard.add_hotkey(self.bindings.JOG_DOWN, lambda: flags["JOG_DOWN"].set())
-        keyboard.add_hotkey(self.bindings.JOG_RAISE, lambda: flags["JOG_RAISE"].set())
-        keyboard.add_hotkey(self.bindings.JOG_LOWER, lambda: flags["JOG_LOWER"].set())
-        keyboard.add_hotkey(self.bindings.JOG_CLOCKWISE, lambda: flags["JOG_CLOCKWISE"].set())
-        keyboard.add_hotkey(self.bindings.JOG_COUNTERCLOCKWISE, lambda: flags["JOG_COUNTERCLOCKWISE"].set())
-        keyboard.add_hotkey(self.bindings.LINEAR_JOG_STEP, lambda: flags["LINEAR_JOG_STEP"].set())
-        keyboard.add_hotkey(self.bindings.VERTICAL_JOG_STEP, lambda: flags["VERTICAL_JOG_STEP"].set())
-        keyboard.add_hotkey(self.bindings.ROTATIONAL_JOG_STEP, lambda: flags["ROTATIONAL_JOG_STEP"].set())
-        keyboard.add_hotkey(self.bindings.HOME, lambda: flags["HOME"].set())
-        keyboard.add_hotkey(self.bindings.HELP, lambda: flags["HELP"].set())
-        keyboard.add_hotkey(self.bindings.QUIT, lambda: running.clear())
-        keyboard.add_hotkey(self.bindings.HELP, lambda: flags["HELP"].set())
-
-        def run_flagged():
-            for action, flag in flags.items():
-                if flag.is_set():
-                    t = threading.Thread(target=funcs[action], daemon=True)
-                    t.start()
-                    flag.clear()
+        busy = {action : threading.Lock() for action in funcs}
+
+        def dispatch(action):
+            # Called from the keyboard hook thread. Actions run on their own
+            # thread, and key repeats are ignored while the action is running.
+            lock = busy[action]
+            if not lock.acquire(blocking=False):
+                return
+
+            def run():
+                try:
+                    funcs[action]()
+                finally:
+                    lock.release()
+
+            threading.Thread(target=run, daemon=True).start()
+
+        # Keep the handles so the hooks can be removed when the loop exits;
+        # otherwise every call to loop() adds another set of callbacks that
+        # run on every key event.
+        hotkeys = [
+            keyboard.add_hotkey(getattr(self.bindings, action), dispatch, args=(action,))
+            for action in funcs
+        ]
+        hotkeys.append(keyboard.add_hotkey(self.bindings.QUIT, done.set))
 
         log.info("Entering keyboard control loop")
-        while running.is_set():
-            run_flagged()
-            time.sleep(0.1)
-        
+        # Waiting with a timeout keeps Ctrl+C responsive on Windows; the wait
+        # still returns as soon as the quit key is pressed.
+        try:
+            while not done.wait(timeout=1.0):
+                pass
+        finally:
+            # Also runs on Ctrl+C, so an interrupted loop does not leak hooks.
+            for hotkey in hotkeys:
+                keyboard.remove_hotkey(hotkey)
 
         # else:
         # clean up all current running actions, make sure all semaphores are freed
@@ -121,7 +121,11 @@ class Experiment:
 
         This function is called once, after the experiment is run. It is
         intended to be used to clean up the experiment and the associated
-        hardware. To define cleanup actions, override this optional function.
+        hardware. It is also called if setup or a run raises an exception, so
+        it is a good place to put hardware (such as lasers) into a safe state.
+        Because setup may not have completed, it should only clean up what
+        setup actually got to. To define cleanup actions, override this
+        optional function.
         """
         pass
 
@@ -135,8 +139,8 @@ class ExperimentRunner:
     [`Experiment`][autogator.experiments.Experiment]. The ``ExperimentRunner`` then
     runs sets up the experiment, sets variables on the Experiment object (such
     as stage and current circuit under test), and runs the experiment on all
-    circuits in the batch. When it is complete, the ``ExperimentRunner`` tears down
-    the experiment.
+    circuits in the batch. When it is complete, or if setup or any run raises
+    an exception, the ``ExperimentRunner`` tears down the experiment.
 
     Parameters
     ----------
@@ -161,11 +165,12 @@ class ExperimentRunner:
 
         experiment: Experiment = self.experiment()
         experiment._stage = stage
-        experiment.setup()
 
-        for circuit in self.circuitmap.circuits:
-            experiment._circuit = circuit
-            stage.set_position_gds(*circuit.loc)
-            experiment.run()
-
-        experiment.teardown()
+        try:
+            experiment.setup()
+            for circuit in self.circuitmap.circuits:
+                experiment._circuit = circuit
+                stage.set_position_gds(*circuit.loc)
+                experiment.run()
+        finally:
+            experiment.teardown()
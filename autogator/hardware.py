@@ -330,10 +330,21 @@ class DataAcquisitionUnitBase(HardwareDevice):
         """
         log.info(f"Acquiring data from {self.name}")
 
-    def get_data(self) -> Any:
+    def wait_for_device(self) -> None:
+        """
+        Blocks until the data acquisition unit has finished acquiring.
+        """
+        log.info(f"Waiting for {self.name}")
+
+    def get_data(self, channel: int) -> Any:
         """
         Gets the acquired data.
 
+        Parameters
+        ----------
+        channel : int
+            The channel to retrieve the data from.
+
         Returns
         -------
         Any
@@ -677,8 +688,51 @@ class Stage:
         stage_pos = self.calibration_matrix @ gds_pos # @ is matrix multiplication
     
         self.set_position(x=stage_pos[0, 0], y=stage_pos[1, 0])
-        actual = self.get_position()
-        log.info(f"CMD: ({stage_pos[0,0], stage_pos[1,0]}), ACT: ({actual[0], actual[1]}), ERR: ({stage_pos[0,0] - actual[0], stage_pos[1,0] - actual[1]})")
+        log.info("CMD: (%s, %s)", stage_pos[0, 0], stage_pos[1, 0])
+        if log.isEnabledFor(logging.DEBUG):
+            # Reading back the motors is slow; only do it if it will be logged.
+            actual = self.get_position()
+            log.debug("ACT: (%s, %s), ERR: (%s, %s)", actual[0], actual[1], stage_pos[0, 0] - actual[0], stage_pos[1, 0] - actual[1])
+
+    def jog_position_gds(self, *, x: float = None, y: float = None, z: float = None) -> None:
+        """
+        Jog the position of the stage in GDS coordinates.
+
+        GDS axes are generally not aligned with the motor axes, so a jog in x
+        or y is performed as an absolute move to the current GDS position plus
+        the jog (see
+        [`set_position_gds()`][autogator.hardware.Stage.set_position_gds]).
+        The z axis is not part of the GDS coordinate system and is jogged in
+        motor units. All parameters are keyword-only.
+
+        The current position is read back from the motors on every call, so
+        scans over a precomputed grid should make absolute moves with
+        [`set_position_gds()`][autogator.hardware.Stage.set_position_gds]
+        instead.
+
+        Parameters
+        ----------
+        x : float, optional
+            The x jog step, in GDS units.
+        y : float, optional
+            The y jog step, in GDS units.
+        z : float, optional
+            The z jog step, in motor units.
+
+        Raises
+        ------
+        UncalibratedStageError
+            If x or y is given and the stage is not calibrated.
+        """
+        if x is not None or y is not None:
+            if self.calibration_matrix is None:
+                raise UncalibratedStageError("Stage is not calibrated (no conversion matrix set), cannot jog position in GDS coordinates")
+
+            stage_pos = np.array([[self.x.get_position()], [self.y.get_position()], [1]])
+            gds_pos = np.linalg.inv(self.calibration_matrix) @ stage_pos
+            self.set_position_gds(gds_pos[0, 0] + (x or 0.0), gds_pos[1, 0] + (y or 0.0))
+        if z is not None:
+            self.jog_position(z=z)
 
     def get_position(self) -> List[float]:
         """
@@ -1574,18 +1628,32 @@ class RohdeSchwarzOscilloscope(DataAcquisitionUnitBase):
         """
         self.driver.acquire(timeout=timeout)
 
-    def get_data(self, channel: int) -> List[float]:
+    def get_data(self, channel: int) -> np.ndarray:
         """
         Gets the data from the specified channel.
+
+        The waveform is transferred as a binary block of little-endian 32-bit
+        floats rather than ASCII, which is about a third of the bytes and
+        needs no text parsing. The format is selected on every call, so it
+        is not affected by other clients or a reset of the device.
         
         Parameters
         ----------
         channel : int
             The channel to retrieve the data from.
+
+        Returns
+        -------
+        np.ndarray
+            The waveform as a ``float32`` array. The scope's resolution does
+            not warrant double precision, and this halves the memory used by
+            long acquisitions.
         """
-        # TODO: Convert this to binary instead of ascii, which is faster?
-        # TODO: Verify return type.
-        return self.driver.get_data(channel)
+        # PyroLab's driver sends "FORM REAL,32" with the data query and parses
+        # the block with PyVISA's query_binary_values, which expects
+        # little-endian values by default.
+        self.driver.write("FORMat:BORDer LSBFirst")
+        return np.asarray(self.driver.get_data(channel, form="real"), dtype=np.float32)
 
     def wait_for_device(self) -> None:
         """
@@ -1618,6 +1686,135 @@ class RohdeSchwarzOscilloscope(DataAcquisitionUnitBase):
         """
         self.driver.set_channel(channel, range=range, coupling=coupling, position=position)
 
+    def set_channels(self, settings: Dict[int, Dict[str, Any]]) -> None:
+        """
+        Sets the parameters of several channels at once.
+
+        All channels are configured with a single write to the device, rather
+        than one round-trip per channel as with
+        [`set_channel()`][autogator.hardware.RohdeSchwarzOscilloscope.set_channel].
+
+        Parameters
+        ----------
+        settings : Dict[int, Dict[str, Any]]
+            A mapping of channel numbers to keyword arguments accepted by
+            [`set_channel()`][autogator.hardware.RohdeSchwarzOscilloscope.set_channel]
+            (``range``, ``coupling``, and ``position``). Missing values take
+            the same defaults.
+        """
+        self.write_batch(self._channel_commands(settings))
+
+    def start_continuous_acquisition(
+        self,
+        channels: Dict[int, Dict[str, Any]],
+        trigger_channel: int,
+        trigger_level: float = 0.0,
+        timescale: float = 10e-9,
+        trigger_mode: str = "NORMal",
+        timeout: float = 5.0,
+    ) -> None:
+        """
+        Configures channels, trigger, and timescale, then runs continuously.
+
+        Everything is sent in a single write to the device. Instead of
+        sleeping for a fixed time, this then blocks until the first
+        acquisition with the new settings is complete (see
+        [`wait_for_acquisition()`][autogator.hardware.RohdeSchwarzOscilloscope.wait_for_acquisition]).
+
+        Parameters
+        ----------
+        channels : Dict[int, Dict[str, Any]]
+            Channel settings, as accepted by
+            [`set_channels()`][autogator.hardware.RohdeSchwarzOscilloscope.set_channels].
+        trigger_channel : int
+            The channel to trigger on.
+        trigger_level : float, optional
+            Voltage threshold for positive slope edge trigger (default 0.0).
+        timescale : float, optional
+            The time (in seconds) per division (default 10e-9).
+        trigger_mode : str, optional
+            The trigger mode, "AUTO", "NORMal", or "FREerun" (default
+            "NORMal").
+        timeout : float, optional
+            Seconds to wait for the first acquisition (default 5.0).
+        """
+        commands = self._channel_commands(channels) + [
+            f"TRIGger1:MODE {trigger_mode}",
+            f"TRIGger1:SOURce CHAN{trigger_channel}",
+            "TRIGger1:TYPE EDGE",
+            "TRIGger1:EDGE:SLOPe POSitive",
+            f"TRIGger1:LEVel{trigger_channel} {trigger_level}",
+            f"TIMebase:SCALe {timescale}",
+            "RUN",
+        ]
+        # A continuous acquisition never completes, so don't wait on *OPC?.
+        self.write_batch(commands, wait=False)
+        self.wait_for_acquisition(timeout=timeout)
+
+    def wait_for_acquisition(self, timeout: float = 5.0, interval: float = 0.05) -> None:
+        """
+        Blocks until the device has completed at least one acquisition.
+
+        Polls the acquisition count after the acquisition was started. This is
+        typically much shorter than sleeping for a fixed time while the first
+        waveform (and any measurements made on it) becomes available.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum number of seconds to wait (default 5.0). If no
+            acquisition completes in that time, a warning is logged and the
+            function returns.
+        interval : float, optional
+            The number of seconds between polls (default 0.05).
+        """
+        deadline = time.monotonic() + timeout
+        while int(float(self.driver.query("ACQuire:CURRent?"))) < 1:
+            if time.monotonic() > deadline:
+                log.warning(f"No acquisition completed on {self.name} after {timeout} s")
+                return
+            time.sleep(interval)
+
+    def write_batch(self, commands: List[str], wait: bool = True) -> None:
+        """
+        Sends several SCPI commands in a single write.
+
+        The commands are joined into one program message, so the device
+        parses them in a single transaction. The device's error queue is
+        checked afterwards, as PyroLab does for each individual write.
+
+        Parameters
+        ----------
+        commands : List[str]
+            The SCPI commands to send, each with its full header (e.g.
+            ``"CHANnel1:RANGe 0.5"``).
+        wait : bool, optional
+            If True, blocks until the device reports that all commands have
+            completed (default True).
+
+        Raises
+        ------
+        InstrumentErrorException
+            If the device reports any errors, e.g. for an out-of-range value.
+        """
+        self.driver.write(";:".join(commands))
+        if wait:
+            self.driver.query("*OPC?")
+        # PyroLab's write_block() (used by set_channel()) does the same check.
+        self.driver.device.ext_error_checking()
+
+    @staticmethod
+    def _channel_commands(settings: Dict[int, Dict[str, Any]]) -> List[str]:
+        commands = []
+        for channel, kwargs in settings.items():
+            commands += [
+                f"CHANnel{channel}:STATe ON",
+                f"CHANnel{channel}:RANGe {kwargs.get('range', 0.5)}",
+                f"CHANnel{channel}:POSition {kwargs.get('position', 0.0)}",
+                f"CHANnel{channel}:COUPling {kwargs.get('coupling', 'DCLimit')}",
+            ]
+        return commands
+
     def set_channel_for_auto_measurement(
         self,
         channel: int,
@@ -34,7 +34,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 from autogator.circuits import Circuit, Input, Output, NotUsed
-from autogator.hardware import DataAcquisitionUnitBase, Stage, LaserBase
+from autogator.hardware import DataAcquisitionUnitBase, RohdeSchwarzOscilloscope, Stage, LaserBase
 from autogator.controllers import KeyboardControl
 
 
@@ -77,7 +77,7 @@ def auto_calibration_callback(
     print("DONE")
 
 def setupScopeWithCircuit(
-        scope: DataAcquisitionUnitBase, 
+        scope: RohdeSchwarzOscilloscope, 
         circuit: Circuit,
         channelRange: float,
         coupling: str,
@@ -86,20 +86,20 @@ def setupScopeWithCircuit(
         ):
     SAMPLE_RATE = 1e12
     DURATION = 1e-8
-    scope = scope.driver
+    driver = scope.driver
     # Set the scope to look at the first output channel
     for index, port in enumerate(circuit.ports):
         if isinstance(port, Output):
             break
     channel = index + 1
-    scope.set_channel(channel, range=channelRange, coupling=coupling, position=position)
-    scope.set_auto_measurement(source=f'C{channel}W1')
-    scope.wait_for_device()
+    driver.set_channel(channel, range=channelRange, coupling=coupling, position=position)
+    driver.set_auto_measurement(source=f'C{channel}W1')
+    driver.wait_for_device()
 
-    scope.edge_trigger(triggerChannel, 0, 'AUTO')
-    scope.acquisition_settings(SAMPLE_RATE, DURATION)
-    scope.acquire(run="continuous")
-    time.sleep(5)
+    driver.edge_trigger(triggerChannel, 0, 'AUTO')
+    driver.acquisition_settings(SAMPLE_RATE, DURATION)
+    driver.acquire(run="continuous")
+    scope.wait_for_acquisition()
 
 def configure_scope_single_measure(self, channel):
         """
@@ -368,7 +368,8 @@ def basic_scan(
         jog_position_function = stage.jog_position
     elif COORDS == 'gds':
         set_position_function = stage.set_position_gds
-        jog_position_function = stage.jog_position_gds
+        # Only used for z, which is not part of the GDS coordinate system.
+        jog_position_function = stage.jog_position
     else:
         raise RuntimeError("Congratulations! This error should never happen, notify the developer.")
 
@@ -376,54 +377,77 @@ def basic_scan(
     x = np.arange(x0, x1 + step_size_x, step_size_x)
     y = np.arange(y0, y1 + step_size_y, step_size_y)
 
-    log.debug(f"Current position: ({stage.x.get_position()}, {stage.y.get_position()})")
-    log.debug(f"Scan range (x): {x[0]} - {x[-1]}")
-    log.debug(f"Scan range (y): {y[0]} - {y[-1]}")
+    if log.isEnabledFor(logging.DEBUG):
+        # Only query the motors if the message will actually be emitted.
+        log.debug("Current position: (%s, %s)", stage.x.get_position(), stage.y.get_position())
+    log.debug("Scan range (x): %s - %s", x[0], x[-1])
+    log.debug("Scan range (y): %s - %s", y[0], y[-1])
 
     rows, cols = len(x), len(y)
     data = np.zeros((rows, cols))
-    pos = []
 
     if plot:
         fig, ax = plt.subplots(1, 1, num="Basic Scan")
         im = ax.imshow(data, cmap="hot", extent=(x0, x1, y0, y1))
         cbar = fig.colorbar(im, ax=ax)
+        vmin, vmax = np.inf, -np.inf
 
     ZLIFTSIZE = 0.1
     jog_position_function(z=ZLIFTSIZE)
     set_position_function(x=float(x[0]), y=float(y[0]))
     jog_position_function(z=-ZLIFTSIZE)
+
+    # GDS axes are generally rotated from the motor axes, so GDS scans move to
+    # each grid point absolutely instead of jogging (which would have to read
+    # back the motors every step and accumulate round-off).
+    absolute = COORDS == 'gds'
+
+    # Bound once; these are called for every grid point.
+    measure = daq.measure
+    sleep = time.sleep
     try:
         for i in range(rows):
             for j in range(cols):
-                time.sleep(settle)
-
-                data[i, j] = daq.measure()
-                loc = i * rows + j + 1
-                if loc < rows * cols:
-                    data.flat[i * rows + j + 1] = np.max(data) * 0.9
+                if absolute and j:
+                    set_position_function(x=float(x[i]), y=float(y[j]))
+                sleep(settle)
 
+                value = measure()
+                data[i, j] = value
                 if plot:
-                    im.set_data(data)
-                    im.autoscale()
-                    fig.canvas.draw_idle()
-                    plt.pause(0.001)
-
-                pos.append((stage.get_position()[0], stage.get_position()[1]))
-                jog_position_function(y=step_size_y)
-
+                    vmin = min(vmin, value)
+                    vmax = max(vmax, value)
+
+                if not absolute:
+                    jog_position_function(y=step_size_y)
+
+            # Redrawing is slow, so the plot is only refreshed once per row.
+            if plot:
+                im.set_data(data)
+                im.set_clim(vmin, vmax)
+                fig.canvas.draw_idle()
+                plt.pause(0.001)
+
+            # Rows are always stepped toward +y; returning with an absolute
+            # move lets the motors compensate for backlash. x is passed too, as
+            # set_position_gds requires both coordinates.
             jog_position_function(z=ZLIFTSIZE)
-            set_position_function(y=float(y[0]))
-            jog_position_function(x=step_size_x)
+            if absolute:
+                if i + 1 < rows:
+                    set_position_function(x=float(x[i + 1]), y=float(y[0]))
+            else:
+                set_position_function(x=float(x[i]), y=float(y[0]))
+                jog_position_function(x=step_size_x)
             jog_position_function(z=-ZLIFTSIZE)
     except KeyboardInterrupt:
         pass
 
     # Get max value and position
-    max_idx = np.argmax(data)
-    max_coord = np.unravel_index(max_idx, data.shape)
+    max_coord = np.unravel_index(np.argmax(data), data.shape)
     max_data = data[max_coord]
-    max_x, max_y = pos[max_idx]
+    # Positions come from the scan grid rather than motor queries, so they are
+    # in the same coordinate system as ``set_position_function``.
+    max_x, max_y = x[max_coord[0]], y[max_coord[1]]
 
     # Move to max position
     jog_position_function(z=ZLIFTSIZE)
@@ -437,6 +461,133 @@ def basic_scan(
     return max_data, (max_x, max_y)
 
 
+def raster_scan(
+    stage: Stage,
+    daq: DataAcquisitionUnitBase,
+    sample_rate: float,
+    stage_center: Tuple[float, float] = None,
+    span: float = 0.06,
+    step_size: float = 0.005,
+    channel: int = 1,
+    plot: bool = False,
+) -> Tuple[float, Tuple[float, float]]:
+    """
+    Performs a box scan as continuous sweeps and a single data acquisition.
+
+    Instead of taking one measurement per grid point, as
+    [`basic_scan()`][autogator.routines.basic_scan] does, the data acquisition
+    unit is armed once and the stage sweeps each row continuously along the
+    y-axis. Rows are always swept toward positive y, so the sweep itself never
+    needs a backlash adjustment; the stage is lifted and returned to the start
+    of the next row in between. The waveform is then downloaded in one
+    transfer and binned into the grid.
+
+    Each sweep is timed relative to the start of the acquisition, so only the
+    samples taken while a row is being swept are used, and the stage is
+    assumed to move at a constant velocity during a sweep. The data
+    acquisition unit must be preconfigured to start acquiring as soon as
+    :py:func:`DataAcquisitionUnitBase.acquire` returns, at ``sample_rate``,
+    for at least as long as the whole raster takes.
+
+    Parameters
+    ----------
+    stage : Stage
+        The stage object that provides access to the hardware.
+    daq : DataAcquisitionUnitBase
+        The preconfigured data acquisition unit to use for taking measurements.
+        This function calls :py:func:`DataAcquisitionUnitBase.acquire` and
+        :py:func:`DataAcquisitionUnitBase.get_data` once each.
+    sample_rate : float
+        The sample rate the data acquisition unit is configured for, in Sa/s.
+    stage_center : Tuple[float, float], optional
+        The (x, y) center of the scan, in motor units. If not specified, the
+        current location is used.
+    span : float, optional
+        The width of the scan, in motor units. The span is from the center
+        +/- span/2 (default 0.06).
+    step_size : float, optional
+        Distance between rows and between grid points within a row, in motor
+        units (default 0.005).
+    channel : int, optional
+        The channel of the data acquisition unit to download (default 1).
+    plot : bool, optional
+        If True, the binned data is plotted with matplotlib once the scan is
+        complete (default False).
+
+    Returns
+    -------
+    value, position : float, Tuple[float, float]
+        The value of the data acquisition unit at the position of the highest
+        reading, and the position of that reading in motor units.
+
+    Raises
+    ------
+    ValueError
+        If a grid point received no samples, either because the acquisition
+        ended before the raster did or because the sample rate is too low.
+    """
+    if stage_center is None:
+        stage_center = (stage.x.get_position(), stage.y.get_position())
+    x0, x1 = stage_center[0] - span/2, stage_center[0] + span/2
+    y0, y1 = stage_center[1] - span/2, stage_center[1] + span/2
+
+    x = np.arange(x0, x1 + step_size, step_size)
+    y = np.arange(y0, y1 + step_size, step_size)
+    rows, cols = len(x), len(y)
+
+    log.debug("Raster range (x): %s - %s", x[0], x[-1])
+    log.debug("Raster range (y): %s - %s", y[0], y[-1])
+
+    ZLIFTSIZE = 0.1
+    stage.jog_position(z=ZLIFTSIZE)
+    stage.set_position(x=float(x[0]), y=float(y[0]))
+    stage.jog_position(z=-ZLIFTSIZE)
+
+    # Start and end time of each row's sweep, relative to the acquisition.
+    windows = []
+    daq.acquire()
+    t0 = time.monotonic()
+    for i in range(rows):
+        if i > 0:
+            stage.jog_position(z=ZLIFTSIZE)
+            stage.set_position(x=float(x[i]), y=float(y[0]))
+            stage.jog_position(z=-ZLIFTSIZE)
+        start = time.monotonic() - t0
+        stage.y.move_to(float(y[-1]))
+        windows.append((start, time.monotonic() - t0))
+    daq.wait_for_device()
+    raw = np.asarray(daq.get_data(channel), dtype=np.float32)
+
+    data = np.zeros((rows, cols))
+    for i, (start, stop) in enumerate(windows):
+        first, last = int(np.ceil(start * sample_rate)), int(stop * sample_rate)
+        sweep = raw[first:last + 1]
+        # Assign each sample to the grid point nearest to where the stage was.
+        fraction = np.linspace(0, 1, len(sweep)) if len(sweep) > 1 else np.zeros(len(sweep))
+        cells = np.rint(fraction * (cols - 1)).astype(int)
+        counts = np.bincount(cells, minlength=cols)
+        if len(sweep) == 0 or last >= len(raw) or not counts.all():
+            raise ValueError(f"Not enough samples to fill row {i} ({len(sweep)} samples for {cols} points)")
+        data[i] = np.bincount(cells, weights=sweep, minlength=cols) / counts
+
+    max_coord = np.unravel_index(data.argmax(), data.shape)
+    max_data = data[max_coord]
+    max_x, max_y = x[max_coord[0]], y[max_coord[1]]
+
+    stage.jog_position(z=ZLIFTSIZE)
+    stage.set_position(x=float(max_x), y=float(max_y))
+    stage.jog_position(z=-ZLIFTSIZE)
+
+    if plot:
+        fig, ax = plt.subplots(1, 1, num="Raster Scan")
+        im = ax.imshow(data, cmap="hot", extent=(x0, x1, y0, y1))
+        fig.colorbar(im, ax=ax)
+        print("Close the plot window to continue...")
+        plt.show(block=True)
+
+    return max_data, (max_x, max_y)
+
+
 def line_scan(
     stage: Stage,
     daq: DataAcquisitionUnitBase,
@@ -651,7 +802,7 @@ def auto_scan(
         settle=settle,
     )
 
-    log.info(f"Coarse max value '{value}' found at {position}")
+    log.info("Coarse max value '%s' found at %s", value, position)
 
     # Fine tune max position
     SEARCH_AREA = 0.025
@@ -662,7 +813,7 @@ def auto_scan(
     stage.set_position(y=y_max)
 
     value = daq.measure()
-    log.info(f"Fine max value '{value}' found at {position}")
+    log.info("Fine max value '%s' found at %s", value, position)
 
     return (x_max, y_max)
 
@@ -783,6 +934,6 @@ def smart_scan(
     position = (x_max, y_max)
 
     value = daq.measure()
-    log.info(f"Fine max value '{value}' found at {position}")
+    log.info("Fine max value '%s' found at %s", value, position)
 
     return position
\ No newline at end of file
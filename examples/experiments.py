@@ -13,10 +13,11 @@ This example uses the Santec TSL-550 as a laser, along with the Rohde & Schwarz
 RTO2064 oscilloscope from PyroLab.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from getpass import getuser
+import os
 from pathlib import Path
-import time
 import logging
 from typing import List
 
@@ -69,11 +70,22 @@ class WavelengthSweepExperiment(Experiment):
         The directory to save the data to.
     chip_name : str
         The name of the chip.
+    save_npy : bool
+        If True, the data is also saved in NumPy's binary ``.npy`` format,
+        which is much faster to write and load than the text file. It holds a
+        structured array with a float64 "Wavelength" field and a float32
+        field per channel ("Ch1", "Ch2", ...).
     """
     # General configuration
     MANUAL = False
     chip_name: str = "fabrun5"
     output_dir = Path("C:/Users/sequo/Documents/GitHub/autogator/examples/fake")
+    save_npy: bool = False
+
+    # Set by setup(); teardown() skips whatever setup didn't get to.
+    laser = None
+    _writer = None
+    _pending = None
 
     # Scope configuration
     duration: float = 5.0
@@ -102,23 +114,28 @@ class WavelengthSweepExperiment(Experiment):
         Start up the laser and scope, enter details about who is running the
         experiment. Do some basic sanity checking on some values.
         """
-        self.operator = input(f"Operator ({getuser()}) [ENTER]: ") 
-        if not self.operator: 
-            self.operator = getuser()
+        user = getuser()
+        self.operator = input(f"Operator ({user}) [ENTER]: ") or user
 
         self.laser = self.stage.laser.driver
         self.scope = self.stage.scope.driver
 
-        self.laser._pyroClaimOwnership()
-        self.laser.on()
-        self.laser.open_shutter()
+        self._writer = ThreadPoolExecutor(max_workers=1)
+        self._pending = None
+        self._laser_sweep_config = None
 
+        # Check before the laser is turned on, so a bad configuration never
+        # leaves it emitting.
         sweep_rate = (self.wl_stop - self.wl_start) / self.duration
         assert sweep_rate > 1.0
         assert sweep_rate < 100.0
         assert self.wl_start >= 1500  # self.laser.MINIMUM_WAVELENGTH
         assert self.wl_stop <= 1630  # self.laser.MAXIMUM_WAVELENGTH
 
+        self.laser._pyroClaimOwnership()
+        self.laser.on()
+        self.laser.open_shutter()
+
     def configure_scope_sweep(self):
         """
         The scope needs to be alternately configured to record a long sweep and
@@ -126,14 +143,12 @@ class WavelengthSweepExperiment(Experiment):
         """
         acquire_time = self.duration + self.buffer
         numSamples = int((acquire_time) * self.sample_rate)
-        print(
-            "Set for {:.2E} Samples @ {:.2E} Sa/s.".format(numSamples, self.sample_rate)
-        )
+        log.info("Set for %.2E Samples @ %.2E Sa/s.", numSamples, self.sample_rate)
 
         self.scope.acquisition_settings(sample_rate=self.sample_rate, duration=acquire_time)
-        for channel in self.active_channels:
-            self.scope.set_channel(channel, **self.channel_settings[channel])
-            time.sleep(0.1)
+        self.stage.scope.set_channels(
+            {channel: self.channel_settings[channel] for channel in self.active_channels}
+        )
 
         self.scope.edge_trigger(self.trigger_channel, self.trigger_level)
 
@@ -147,22 +162,30 @@ class WavelengthSweepExperiment(Experiment):
         RANGE = 2.0
         POSITION = -3.0
 
-        self.scope.set_channel(1, range=RANGE, position=POSITION)
-        self.scope.set_channel(2, range=RANGE, position=POSITION)
         self.scope.set_auto_measurement(source=F"C{MEAS_CHANNEL}W1")
-        self.scope.wait_for_device()
-
-        self.scope.edge_trigger(1, 0.0)
-        self.scope.set_timescale(10e-10)
-        self.scope.acquire(run="continuous")
-        time.sleep(5)
+        self.stage.scope.start_continuous_acquisition(
+            {
+                1: {"range": RANGE, "position": POSITION},
+                2: {"range": RANGE, "position": POSITION},
+            },
+            trigger_channel=1,
+            trigger_level=0.0,
+            timescale=10e-10,
+        )
 
     def configure_laser_sweep(self):
         """
         The laser needs to be alternately configured to sweep in wavelength and
         to return to the peak-power wavelength for alignment purposes. This
         function reconfigures for a wavelength sweep.
+
+        Switching to a single measurement only changes the wavelength, so the
+        sweep settings are only sent again if they have changed.
         """
+        config = (self.power_dBm, self.trigger_step)
+        if config == self._laser_sweep_config:
+            return
+
         self.laser.power_dBm(self.power_dBm)
         self.laser.sweep_set_mode(
             continuous=True, twoway=True, trigger=False, const_freq_step=False
@@ -171,6 +194,7 @@ class WavelengthSweepExperiment(Experiment):
         self.laser.trigger_enable_output()
         self.laser.trigger_set_mode("Step")
         self.laser.trigger_step(self.trigger_step)
+        self._laser_sweep_config = config
 
     def configure_laser_measure(self):
         """
@@ -184,7 +208,7 @@ class WavelengthSweepExperiment(Experiment):
         """
         The test procedure for every device under test.
         """
-        print(self.circuit)
+        log.info("Testing %s", self.circuit)
 
         self.configure_scope_measure()
         self.configure_laser_measure()
@@ -206,12 +230,33 @@ class WavelengthSweepExperiment(Experiment):
         # scope.screenshot(screenshot_filename)
 
         log.debug("Downloading raw data...")
-        raw = {}
-        for channel in self.active_channels:
-            raw[channel] = self.scope.get_data(channel)
+        raw = {channel: self.stage.scope.get_data(channel) for channel in self.active_channels}
         wavelengthLog = self.laser.wavelength_logging()
 
-        print("Processing Data")
+        # Process and save in the background while the stage moves on to the
+        # next circuit. Only one result is kept in flight, so waiting on the
+        # previous one also surfaces any error it raised.
+        if self._pending is not None:
+            self._pending.result()
+        self._pending = self._writer.submit(self.save_data, self.circuit, raw, wavelengthLog)
+
+    def save_data(self, circuit, raw, wavelengthLog):
+        """
+        Converts the raw data to wavelength and saves it to a text file.
+
+        Runs on a background thread, so it only uses the arguments passed in
+        and configuration attributes that don't change between runs.
+
+        Parameters
+        ----------
+        circuit : Circuit
+            The circuit the data was collected on.
+        raw : Dict[int, ndarray]
+            The raw data for each active channel.
+        wavelengthLog : ndarray
+            The wavelength log from the laser.
+        """
+        log.debug("Processing data...")
         analysis = WavelengthAnalyzer(
             sample_rate=self.sample_rate,
             wavelength_log=wavelengthLog,
@@ -224,30 +269,69 @@ class WavelengthSweepExperiment(Experiment):
         }
 
         today = datetime.now()
-        date_prefix = f"{today.year}_{today.month}_{today.day}_{today.hour}_{today.minute}_"
-        filename = self.output_dir / f"{date_prefix}_{self.chip_name}_locx_{self.circuit.loc.x}_locy_{self.circuit.loc.y}".replace(".", "p")
+        date_prefix = today.strftime("%Y_%m_%d_%H_%M_")
+        filename = self.output_dir / f"{date_prefix}_{self.chip_name}_locx_{circuit.loc.x}_locy_{circuit.loc.y}".replace(".", "p")
         filename = filename.with_suffix(".wlsweep")
-        
+
+        columns = "\t".join(f"Ch{channel}" for channel in sorted_data)
         FILE_HEADER = f"""Test performed at {today.strftime("%Y-%m-%d %H:%M:%S")}
 Operator: {self.operator}
 Chip: {self.chip_name}
-Circuit: {self.circuit.loc.x}, {self.circuit.loc.y}
+Circuit: {circuit.loc.x}, {circuit.loc.y}
 Laser power: {self.power_dBm} dBm
 Wavelength start: {self.wl_start} nm
 Wavelength stop: {self.wl_stop} nm
 
-Wavelength\tCh1"""
-
-        print("Saving raw data.")
-        data_lists = []
-        for channel in self.data_channels:
-            if not data_lists:
-                data_lists = [sorted_data[channel].wl]
-            data_lists.append(sorted_data[channel].data)
-        np.savetxt(filename, np.column_stack(data_lists), delimiter="\t", header=FILE_HEADER)
+Wavelength\t{columns}"""
+
+        log.debug("Saving data to %s", filename)
+        # All channels share the wavelength axis computed by the analyzer.
+        wavelengths = next(iter(sorted_data.values())).wl
+        arr = np.column_stack([wavelengths] + [result.data for result in sorted_data.values()])
+        # Data is float32; 9 significant digits are enough to read back every
+        # value exactly, while the default format would write widened float32
+        # noise (0.1 becomes 1.000000014901161194e-01).
+        fmt = ["%.18e"] + ["%.9g"] * len(sorted_data)
+        # A large binary buffer lets savetxt's many small row writes reach the
+        # disk in a few large system calls. Binary mode doesn't translate line
+        # endings, so use the platform's (CRLF on Windows) as text mode did.
+        # The file is encoded as UTF-8 (savetxt defaults to latin1, which
+        # fails on many operator names).
+        with open(filename, "wb", buffering=8 * 1024 * 1024) as out:
+            np.savetxt(
+                out,
+                arr,
+                fmt=fmt,
+                delimiter="\t",
+                newline=os.linesep,
+                header=FILE_HEADER.replace("\n", os.linesep),
+                encoding="utf-8",
+            )
+        if self.save_npy:
+            # column_stack promotes everything to float64, so store the
+            # channels in their own float32 fields instead.
+            record = np.empty(
+                len(wavelengths),
+                dtype=[("Wavelength", np.float64)] + [(f"Ch{channel}", np.float32) for channel in sorted_data],
+            )
+            record["Wavelength"] = wavelengths
+            for channel, result in sorted_data.items():
+                record[f"Ch{channel}"] = result.data
+            np.save(filename.with_suffix(".npy"), record)
 
     def teardown(self):
-        pass
+        """
+        Closes the laser shutter and waits for the last dataset to finish
+        saving. Also safe to call if setup didn't complete.
+        """
+        try:
+            if self.laser is not None:
+                self.laser.close_shutter()
+        finally:
+            if self._writer is not None:
+                self._writer.shutdown(wait=True)
+            if self._pending is not None:
+                self._pending.result()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from autogator.analysis import WavelengthAnalyzer
+
+
+SAMPLE_RATE = 1000.0
+
+
+@pytest.fixture
+def analyzer():
+    trigger = np.zeros(1000)
+    trigger[100:901:100] = 5.0
+    wavelength_log = np.linspace(1500, 1580, 9)
+    return WavelengthAnalyzer(SAMPLE_RATE, trigger, wavelength_log)
+
+
+class TestWavelengthAnalyzer:
+    def test_process_data(self, analyzer):
+        raw = np.arange(1000, dtype=np.float32)
+        result = analyzer.process_data(raw)
+        np.testing.assert_array_equal(result.data, raw[100:900])
+        assert result.data.dtype == np.float32
+        assert len(result.wl) == len(result.data)
+        np.testing.assert_allclose(result.wl[::100], np.linspace(1500, 1570, 8))
+
+    def test_channels_share_wavelengths(self, analyzer):
+        first = analyzer.process_data(np.ones(1000))
+        second = analyzer.process_data(np.zeros(1000))
+        np.testing.assert_array_equal(first.wl, second.wl)
+
+    def test_wavelengths_read_only(self, analyzer):
+        result = analyzer.process_data(np.ones(1000))
+        with pytest.raises(ValueError):
+            result.wl[0] = 0.0
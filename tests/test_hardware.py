@@ -0,0 +1,184 @@
+import logging
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import autogator.hardware as hardware
+from autogator.errors import UncalibratedStageError
+from autogator.hardware import LinearStageBase, RohdeSchwarzOscilloscope, Stage
+
+
+class FakeVisaDevice:
+    def __init__(self, calls, errors=None):
+        self.calls = calls
+        self.errors = errors
+
+    def ext_error_checking(self):
+        self.calls.append(("ext_error_checking",))
+        if self.errors:
+            raise RuntimeError(self.errors)
+
+
+class FakeRTO:
+    """Records the calls made to PyroLab's RTO driver."""
+    def __init__(self):
+        self.calls = []
+        self.device = FakeVisaDevice(self.calls)
+        # Responses to ACQuire:CURRent?, in order; the last one repeats.
+        self.acquisitions = ["1"]
+
+    def write(self, message):
+        self.calls.append(("write", message))
+
+    def query(self, message):
+        self.calls.append(("query", message))
+        if message == "ACQuire:CURRent?":
+            if len(self.acquisitions) > 1:
+                return self.acquisitions.pop(0)
+            return self.acquisitions[0]
+        return "1"
+
+    def get_data(self, channel, form="ascii"):
+        self.calls.append(("get_data", channel, form))
+        return [0.1, 0.2, 0.3]
+
+
+def make_scope():
+    # Skip __init__, which connects to a real device.
+    scope = RohdeSchwarzOscilloscope.__new__(RohdeSchwarzOscilloscope)
+    scope.name = "scope"
+    scope.driver = FakeRTO()
+    return scope
+
+
+class TestRohdeSchwarzOscilloscope:
+    def test_get_data_binary(self):
+        scope = make_scope()
+        data = scope.get_data(2)
+        assert scope.driver.calls == [
+            ("write", "FORMat:BORDer LSBFirst"),
+            ("get_data", 2, "real"),
+        ]
+        assert data.dtype == np.float32
+        np.testing.assert_allclose(data, [0.1, 0.2, 0.3], rtol=1e-6)
+
+    def test_write_batch(self):
+        scope = make_scope()
+        scope.write_batch(["CHANnel1:RANGe 0.5", "RUN"])
+        assert scope.driver.calls == [
+            ("write", "CHANnel1:RANGe 0.5;:RUN"),
+            ("query", "*OPC?"),
+            ("ext_error_checking",),
+        ]
+
+    def test_write_batch_no_wait(self):
+        scope = make_scope()
+        scope.write_batch(["RUN"], wait=False)
+        assert scope.driver.calls == [("write", "RUN"), ("ext_error_checking",)]
+
+    def test_write_batch_errors(self):
+        scope = make_scope()
+        scope.driver.device.errors = ['-222,"Data out of range"']
+        with pytest.raises(RuntimeError):
+            scope.write_batch(["CHANnel1:RANGe 1000"])
+
+    def test_set_channels(self):
+        scope = make_scope()
+        scope.set_channels({1: {}, 3: {"range": 0.1, "coupling": "AC", "position": -2.5}})
+        assert scope.driver.calls == [
+            ("write", ";:".join([
+                "CHANnel1:STATe ON",
+                "CHANnel1:RANGe 0.5",
+                "CHANnel1:POSition 0.0",
+                "CHANnel1:COUPling DCLimit",
+                "CHANnel3:STATe ON",
+                "CHANnel3:RANGe 0.1",
+                "CHANnel3:POSition -2.5",
+                "CHANnel3:COUPling AC",
+            ])),
+            ("query", "*OPC?"),
+            ("ext_error_checking",),
+        ]
+
+    def test_start_continuous_acquisition(self):
+        scope = make_scope()
+        scope.start_continuous_acquisition({2: {}}, trigger_channel=2, trigger_level=0.1, timescale=1e-6)
+        assert scope.driver.calls == [
+            ("write", ";:".join([
+                "CHANnel2:STATe ON",
+                "CHANnel2:RANGe 0.5",
+                "CHANnel2:POSition 0.0",
+                "CHANnel2:COUPling DCLimit",
+                "TRIGger1:MODE NORMal",
+                "TRIGger1:SOURce CHAN2",
+                "TRIGger1:TYPE EDGE",
+                "TRIGger1:EDGE:SLOPe POSitive",
+                "TRIGger1:LEVel2 0.1",
+                "TIMebase:SCALe 1e-06",
+                "RUN",
+            ])),
+            ("ext_error_checking",),
+            ("query", "ACQuire:CURRent?"),
+        ]
+
+    def test_wait_for_acquisition_polls(self, monkeypatch):
+        monkeypatch.setattr(hardware, "time", SimpleNamespace(monotonic=lambda: 0.0, sleep=lambda s: None))
+        scope = make_scope()
+        scope.driver.acquisitions = ["0", "0", "1"]
+        scope.wait_for_acquisition(interval=0)
+        assert scope.driver.calls == [("query", "ACQuire:CURRent?")] * 3
+
+    def test_wait_for_acquisition_timeout(self, monkeypatch, caplog):
+        now = [0.0]
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        monkeypatch.setattr(hardware, "time", SimpleNamespace(monotonic=lambda: now[0], sleep=sleep))
+        scope = make_scope()
+        scope.driver.acquisitions = ["0"]
+        with caplog.at_level(logging.WARNING):
+            scope.wait_for_acquisition(timeout=1.0, interval=0.25)
+        assert len(scope.driver.calls) == 6
+        assert "No acquisition completed" in caplog.text
+
+
+class FakeLinearStage(LinearStageBase):
+    def __init__(self, name):
+        super().__init__(name)
+        self.position = 0.0
+
+    def move_to(self, position):
+        self.position = position
+
+    def move_by(self, distance):
+        self.position += distance
+
+    def get_position(self):
+        return self.position
+
+
+class TestStage:
+    def make_stage(self):
+        # GDS axes rotated 90 degrees from the motor axes, offset by (10, 20).
+        calibration = np.array([[0, -1, 10], [1, 0, 20], [0, 0, 1]], dtype=float)
+        return Stage(
+            x=FakeLinearStage("x"),
+            y=FakeLinearStage("y"),
+            z=FakeLinearStage("z"),
+            calibration_matrix=calibration,
+        )
+
+    def test_jog_position_gds(self):
+        stage = self.make_stage()
+        stage.set_position_gds(1, 2)
+        stage.jog_position_gds(y=0.5, z=0.1)
+        assert (stage.x.position, stage.y.position) == pytest.approx((10 - 2.5, 20 + 1))
+        assert stage.z.position == pytest.approx(0.1)
+
+    def test_jog_position_gds_uncalibrated(self):
+        stage = self.make_stage()
+        stage.calibration_matrix = None
+        with pytest.raises(UncalibratedStageError):
+            stage.jog_position_gds(x=1)
@@ -0,0 +1,166 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from autogator.hardware import LinearStageBase, Stage
+import autogator.routines as routines
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeMotor:
+    SPEED = 0.06  # units per second
+
+    def __init__(self, stage, position=0.0):
+        self.stage = stage
+        self.position = position
+
+    def get_position(self):
+        return self.position
+
+    def move_to(self, position):
+        self.stage.record()
+        self.stage.clock.now += abs(position - self.position) / self.SPEED
+        self.position = position
+        self.stage.record()
+
+
+class FakeStage:
+    """Moves one motor at a time and records its trajectory."""
+    def __init__(self, clock):
+        self.clock = clock
+        self.history = []
+        self.x, self.y, self.z = FakeMotor(self), FakeMotor(self), FakeMotor(self)
+
+    def record(self):
+        self.history.append((self.clock.now, self.x.position, self.y.position))
+
+    def set_position(self, x=None, y=None):
+        if x is not None:
+            self.x.move_to(x)
+        if y is not None:
+            self.y.move_to(y)
+
+    def jog_position(self, x=None, y=None, z=None):
+        for motor, step in ((self.x, x), (self.y, y), (self.z, z)):
+            if step is not None:
+                motor.move_to(motor.position + step)
+
+
+class CountingLinearStage(LinearStageBase):
+    """Counts position queries, which are slow on real motors."""
+    def __init__(self, name):
+        super().__init__(name)
+        self.position = 0.0
+        self.queries = 0
+
+    def move_to(self, position):
+        self.position = position
+
+    def move_by(self, distance):
+        self.position += distance
+
+    def get_position(self):
+        self.queries += 1
+        return self.position
+
+
+class FakeDAQ:
+    """Samples a Gaussian spot along the stage's recorded trajectory."""
+    def __init__(self, stage, sample_rate, duration, peak, width=0.004):
+        self.stage = stage
+        self.sample_rate = sample_rate
+        self.duration = duration
+        self.peak = peak
+        self.width = width
+
+    def acquire(self):
+        self.start = self.stage.clock.now
+
+    def wait_for_device(self):
+        pass
+
+    def measure(self):
+        r2 = (self.stage.x.position - self.peak[0])**2 + (self.stage.y.position - self.peak[1])**2
+        return np.exp(-r2 / (2 * self.width**2))
+
+    def get_data(self, channel):
+        t, x, y = np.array(self.stage.history).T
+        samples = self.start + np.arange(int(self.duration * self.sample_rate)) / self.sample_rate
+        xs, ys = np.interp(samples, t, x), np.interp(samples, t, y)
+        r2 = (xs - self.peak[0])**2 + (ys - self.peak[1])**2
+        return np.exp(-r2 / (2 * self.width**2))
+
+
+@pytest.fixture
+def stage(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(routines, "time", SimpleNamespace(monotonic=clock, sleep=lambda s: None))
+    return FakeStage(clock)
+
+
+class TestRasterScan:
+    SPAN = 0.06
+    STEP = 0.01
+    SAMPLE_RATE = 1000.0
+
+    def grid(self):
+        x = np.arange(-self.SPAN/2, self.SPAN/2 + self.STEP, self.STEP)
+        return x, x.copy()
+
+    def test_finds_peak(self, stage):
+        x, y = self.grid()
+        peak = (x[2], y[4])
+        daq = FakeDAQ(stage, self.SAMPLE_RATE, duration=60, peak=peak)
+        _, position = routines.raster_scan(
+            stage, daq, self.SAMPLE_RATE, stage_center=(0, 0), span=self.SPAN, step_size=self.STEP
+        )
+        assert position == pytest.approx(peak)
+        assert (stage.x.position, stage.y.position) == pytest.approx(peak)
+
+    def test_acquisition_too_short(self, stage):
+        x, y = self.grid()
+        daq = FakeDAQ(stage, self.SAMPLE_RATE, duration=2, peak=(x[2], y[4]))
+        with pytest.raises(ValueError):
+            routines.raster_scan(
+                stage, daq, self.SAMPLE_RATE, stage_center=(0, 0), span=self.SPAN, step_size=self.STEP
+            )
+
+
+class TestBasicScan:
+    def test_finds_peak(self, stage):
+        x = np.arange(-0.03, 0.03 + 0.01, 0.01)
+        peak = (x[5], x[1])
+        daq = FakeDAQ(stage, 1000.0, duration=0, peak=peak)
+        value, position = routines.basic_scan(
+            stage, daq, stage_center=(0, 0), span=0.06, step_size=0.01, settle=0
+        )
+        assert value == pytest.approx(1.0)
+        assert position == pytest.approx(peak)
+        assert (stage.x.position, stage.y.position) == pytest.approx(peak)
+
+    def test_gds_no_position_queries(self, stage):
+        # GDS axes rotated 90 degrees from the motor axes, offset by (10, 20).
+        calibration = np.array([[0, -1, 10], [1, 0, 20], [0, 0, 1]], dtype=float)
+        gds_stage = Stage(
+            x=CountingLinearStage("x"),
+            y=CountingLinearStage("y"),
+            z=CountingLinearStage("z"),
+            calibration_matrix=calibration,
+        )
+        x = np.arange(-0.03, 0.03 + 0.01, 0.01)
+        peak = (x[5], x[1])
+        daq = FakeDAQ(gds_stage, 1000.0, duration=0, peak=(10 - peak[1], 20 + peak[0]))
+        value, position = routines.basic_scan(
+            gds_stage, daq, gds_center=(0, 0), span=0.06, step_size=0.01, settle=0
+        )
+        assert value == pytest.approx(1.0)
+        assert position == pytest.approx(peak)
+        assert sum(motor.queries for motor in (gds_stage.x, gds_stage.y, gds_stage.z)) == 0